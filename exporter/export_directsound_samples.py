@@ -1,16 +1,32 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
-from dataclasses import dataclass, asdict
+import sys
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
-DS_SYMBOL_RE = re.compile(r"\b(DirectSoundWaveData_[A-Za-z0-9_]+)\b")
+import msgspec
 
-@dataclass
-class SampleEntry:
+# Allow running as a plain script (python3 exporter/export_directsound_samples.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# One shared, precompiled symbol pattern for both scanner modules
+from gba_mapper.sample_parser import DS_SYMBOL_RE, DS_SYMBOL_RE_B  # noqa: E402,F401
+
+# Cheap substring prefilter: files without this literal need no regex at all
+DS_PREFIX_B = b"DirectSoundWaveData_"
+
+# Text-ish extensions worth scanning (lowercase, including the dot)
+TEXT_EXTS = frozenset({".inc", ".s", ".c", ".h", ".txt", ".cfg", ".json", ".asm"})
+
+# msgspec.Struct instances are leaner than dataclasses (C-level slots,
+# cheaper instantiation) and msgspec encodes them natively
+class SampleEntry(msgspec.Struct):
     id: int
     symbol: str
     name: str
@@ -19,20 +35,24 @@ class SampleEntry:
     sources: List[str]
 
 
+# One anchored pattern replaces the prefix-stripping loop: optional
+# DirectSoundWaveData_ prefix, optional bank prefix, rest is the base.
+# Alternation order matters (sc88pro before sc88, like the old loop).
+_SYMBOL_NORM_RE = re.compile(
+    r"^(?:DirectSoundWaveData_)?(?:(sc88pro|sc55|sc88|gm|gs|xg)_)?(.*)$"
+)
+
+
+# The same bank/base stems repeat across hundreds of symbols, so the three
+# normalization helpers are worth memoizing (inputs are plain strings).
+@lru_cache(maxsize=None)
 def normalize_symbol(symbol: str) -> Tuple[Optional[str], str]:
-    base = symbol
-    if base.startswith("DirectSoundWaveData_"):
-        base = base[len("DirectSoundWaveData_"):]
-    bank = None
-    for b in ("sc88pro", "sc55", "sc88", "gm", "gs", "xg"):
-        pref = b + "_"
-        if base.startswith(pref):
-            bank = b
-            base = base[len(pref):]
-            break
-    return bank, base
+    m = _SYMBOL_NORM_RE.match(symbol)
+    assert m is not None  # pattern matches any string
+    return m.group(1), m.group(2)
 
 
+@lru_cache(maxsize=None)
 def pretty_name_from_base(base: str) -> str:
     words = base.strip("_").split("_")
     replacements = {
@@ -60,25 +80,49 @@ def pretty_name_from_base(base: str) -> str:
     return " ".join(titled).strip()
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=None)
 def slugify(bank: Optional[str], base: str) -> str:
     raw = f"{bank}-{base}" if bank else base
-    return re.sub(r"[^a-z0-9]+", "-", raw.lower()).strip("-")
+    return _SLUG_RE.sub("-", raw.lower()).strip("-")
+
+
+def _scan_tree(top: str, paths: List[Path]) -> None:
+    # os.scandir gives us file type info from the dir entry itself (no extra
+    # stat per path like rglob + is_file does)
+    try:
+        entries = os.scandir(top)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _scan_tree(entry.path, paths)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            # Slice the suffix out by hand: one rfind + one frozenset probe,
+            # no splitext tuple and no per-call set literal
+            name = entry.name
+            dot = name.rfind(".")
+            if dot > 0 and name[dot:].lower() in TEXT_EXTS:
+                paths.append(Path(entry.path))
 
 
 def iter_text_files(repo_root: Path) -> List[Path]:
-    exts = {".inc", ".s", ".c", ".h", ".txt", ".cfg", ".json", ".asm"}
     paths: List[Path] = []
 
     # Prefer sound/ but also allow whole-repo scan
     sound_dir = repo_root / "sound"
     if sound_dir.exists():
-        for p in sound_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts:
-                paths.append(p)
+        _scan_tree(str(sound_dir), paths)
     else:
-        for p in repo_root.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts:
-                paths.append(p)
+        _scan_tree(str(repo_root), paths)
 
     return paths
 
@@ -88,20 +132,54 @@ def scan_directsound_symbols(repo_root: Path, *, debug: bool = False) -> Dict[st
     if debug:
         print(f"Scanning {len(files)} files under: {repo_root}")
 
-    hits: Dict[str, Set[str]] = {}
-    for p in files:
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
+    # Every scanned path lives under repo_root, so relative paths are just a
+    # prefix strip; compute the prefix once instead of Path.relative_to per file
+    root_prefix = str(repo_root)
+    if not root_prefix.endswith(os.sep):
+        root_prefix += os.sep
+    prefix_len = len(root_prefix)
+
+    def scan_batch(batch: List[Path]) -> Dict[bytes, Set[str]]:
+        # Concatenate the batch into one buffer and run the compiled DFA scan
+        # once over it, instead of paying per-file finditer setup. A newline
+        # separator keeps symbols from spanning file boundaries; matches are
+        # attributed back to files by bisecting the cumulative end offsets.
+        chunks: List[bytes] = []
+        ends: List[int] = []
+        rels: List[str] = []
+        total = 0
+        for p in batch:
+            try:
+                data = p.read_bytes()
+            except Exception:
+                continue
+            if not data or data.find(DS_PREFIX_B) < 0:
+                continue
+            chunks.append(data)
+            chunks.append(b"\n")
+            total += len(data) + 1
+            ends.append(total)
+            sp = str(p)
+            rels.append(sp[prefix_len:] if sp.startswith(root_prefix) else sp)
+
+        if not chunks:
+            return {}
+
+        buf = b"".join(chunks)
+        out: Dict[bytes, Set[str]] = {}
+        for m in DS_SYMBOL_RE_B.finditer(buf):
+            out.setdefault(m.group(1), set()).add(rels[bisect_right(ends, m.start())])
+        return out
 
-        found = DS_SYMBOL_RE.findall(text)
-        if not found:
-            continue
+    hits: Dict[str, Set[str]] = {}
+    batches = [files[i:i + 64] for i in range(0, len(files), 64)]
 
-        rel = str(p.relative_to(repo_root))
-        for sym in set(found):
-            hits.setdefault(sym, set()).add(rel)
+    # File scanning is mostly I/O + C-level regex work, both of which release
+    # the GIL, so a small thread pool overlaps nicely.
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) + 2)) as pool:
+        for part in pool.map(scan_batch, batches):
+            for sym, rels_found in part.items():
+                hits.setdefault(sym.decode("ascii"), set()).update(rels_found)
 
     if debug:
         print(f"Found {len(hits)} unique DirectSoundWaveData_* symbols.")
@@ -109,29 +187,25 @@ def scan_directsound_symbols(repo_root: Path, *, debug: bool = False) -> Dict[st
 
 
 def build_entries(symbol_sources: Dict[str, Set[str]]) -> List[SampleEntry]:
-    items: List[Tuple[str, str, str, Optional[str], str, List[str]]] = []
+    # Normalize each symbol exactly once; ids are assigned after sorting.
+    out: List[SampleEntry] = []
     for sym, sources in symbol_sources.items():
         bank, base = normalize_symbol(sym)
-        name = pretty_name_from_base(base)
-        slug = slugify(bank, base)
-        items.append((name.lower(), sym.lower(), sym, bank, slug, sorted(sources)))
-
-    # stable ordering: name then symbol
-    items.sort(key=lambda t: (t[0], t[1]))
-
-    out: List[SampleEntry] = []
-    for i, (_nk, _sk, sym, bank, slug, sources) in enumerate(items):
-        bank2, base2 = normalize_symbol(sym)
         out.append(
             SampleEntry(
-                id=i,
+                id=-1,
                 symbol=sym,
-                name=pretty_name_from_base(base2),
-                bank=bank2,
-                slug=slugify(bank2, base2),
-                sources=sources,
+                name=pretty_name_from_base(base),
+                bank=bank,
+                slug=slugify(bank, base),
+                sources=sorted(sources),
             )
         )
+
+    # stable ordering: name then symbol (casefold computed once per entry)
+    out.sort(key=lambda e: (e.name.casefold(), e.symbol.casefold()))
+    for i, e in enumerate(out):
+        e.id = i
     return out
 
 
@@ -149,8 +223,9 @@ def main() -> None:
     symbol_sources = scan_directsound_symbols(repo_root, debug=args.debug)
     entries = build_entries(symbol_sources)
 
-    # Flat array output, exactly like your example
-    args.out.write_text(json.dumps([asdict(e) for e in entries], indent=2, ensure_ascii=False), encoding="utf-8")
+    # Flat array output, exactly like your example (msgspec encodes the
+    # structs natively, no asdict deep-copy needed)
+    args.out.write_bytes(msgspec.json.format(msgspec.json.encode(entries), indent=2))
     print(f"Wrote {args.out} ({len(entries)} samples).")
 
 
@@ -2,14 +2,25 @@
 from __future__ import annotations
 
 import argparse
-import json
-from dataclasses import dataclass
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import msgspec
+import orjson
 
-@dataclass(frozen=True)
-class Sample:
+# Shared constant pieces of the .inc output, interned so the padded lines
+# repeated up to 128 times all reference one string object.
+VOICE_GROUP_PREFIX = sys.intern("voice_group ")
+DRUMSET_LINE = sys.intern("\tvoice_keysplit_all voicegroup_rs_drumset")
+SQUARE_PAD_LINE = sys.intern("\tvoice_square_1 60, 0, 0, 2, 0, 0, 15, 0")
+FALLBACK_PAD_SYMBOL = sys.intern("DirectSoundWaveData_sc88pro_flute")
+
+# Common flute-like DirectSound params, also the --ds-params default
+DEFAULT_DS_PARAMS: Tuple[int, int, int, int] = (255, 127, 231, 127)
+
+
+class Sample(msgspec.Struct, frozen=True):
     symbol: str
     name: str
     bank: Optional[str] = None
@@ -21,45 +32,62 @@ def load_directsound_db(db_path: Path) -> Tuple[Dict[str, Sample], Dict[str, Sam
     Returns three lookup maps:
       by_symbol: DirectSoundWaveData_* -> Sample
       by_slug:   slug -> Sample
-      by_name:   lower(name) -> Sample
+      by_name:   whitespace-normalized lower(name) -> Sample
 
     Supports DB formats:
       - top-level list: [ {...}, {...} ]
       - wrapped dict: { "directsound": [ {...}, {...} ] }
     """
-    data = json.loads(db_path.read_text(encoding="utf-8"))
-
-    if isinstance(data, list):
-        items = data
-    elif isinstance(data, dict):
-        items = data.get("directsound", [])
-    else:
-        raise ValueError(f"Invalid DB JSON: expected list or dict, got {type(data).__name__}")
-
-    if not isinstance(items, list):
-        raise ValueError("Invalid DB JSON: expected entries to be a list")
+    raw = db_path.read_bytes()
+
+    samples: List[Sample]
+    try:
+        # Fast path: the common top-level-list layout decodes straight into
+        # typed Sample structs in one C-level pass (unknown fields like id
+        # and sources are ignored).
+        samples = msgspec.json.decode(raw, type=List[Sample])
+    except msgspec.DecodeError:
+        # Wrapped-dict layout or entries that need per-field cleanup
+        data = orjson.loads(raw)
+
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict):
+            items = data.get("directsound", [])
+        else:
+            raise ValueError(f"Invalid DB JSON: expected list or dict, got {type(data).__name__}")
+
+        if not isinstance(items, list):
+            raise ValueError("Invalid DB JSON: expected entries to be a list")
+
+        samples = []
+        for it in items:
+            if not isinstance(it, dict):
+                continue
+            sym = it.get("symbol")
+            name = it.get("name")
+            if not isinstance(sym, str) or not isinstance(name, str):
+                continue
+            samples.append(
+                Sample(
+                    symbol=sym,
+                    name=name,
+                    bank=it.get("bank") if isinstance(it.get("bank"), str) else None,
+                    slug=it.get("slug") if isinstance(it.get("slug"), str) else None,
+                )
+            )
 
     by_symbol: Dict[str, Sample] = {}
     by_slug: Dict[str, Sample] = {}
     by_name: Dict[str, Sample] = {}
 
-    for it in items:
-        if not isinstance(it, dict):
-            continue
-        sym = it.get("symbol")
-        name = it.get("name")
-        if not isinstance(sym, str) or not isinstance(name, str):
-            continue
-        sample = Sample(
-            symbol=sym,
-            name=name,
-            bank=it.get("bank") if isinstance(it.get("bank"), str) else None,
-            slug=it.get("slug") if isinstance(it.get("slug"), str) else None,
-        )
-        by_symbol[sym] = sample
+    for sample in samples:
+        by_symbol[sample.symbol] = sample
         if sample.slug:
             by_slug[sample.slug] = sample
-        by_name[name.strip().lower()] = sample
+        # Normalize whitespace once at load time so lookups are a plain
+        # dict hit instead of a forgiving linear scan per token.
+        by_name[" ".join(sample.name.lower().split())] = sample
 
     if not by_symbol:
         raise ValueError("DB JSON contains no valid directsound entries")
@@ -82,16 +110,10 @@ def resolve_sample(
     if t in by_slug:
         return by_slug[t]
 
-    # Try case-insensitive name
-    t_low = t.lower()
-    if t_low in by_name:
-        return by_name[t_low]
-
-    # Try a forgiving name match (remove extra spaces)
-    t_low_norm = " ".join(t_low.split())
-    for k, v in by_name.items():
-        if " ".join(k.split()) == t_low_norm:
-            return v
+    # Try case-insensitive name (keys are whitespace-normalized at load time)
+    t_low_norm = " ".join(t.lower().split())
+    if t_low_norm in by_name:
+        return by_name[t_low_norm]
 
     raise KeyError(f"Instrument not found in DB: {token}")
 
@@ -117,10 +139,10 @@ def write_voicegroup_file(
 
     lines: List[str] = []
     # Your repo format example uses: voice_group route101
-    lines.append(f"voice_group {group_name}")
+    lines.append(VOICE_GROUP_PREFIX + group_name)
 
     # Always reserve slot 0 for the RS drumset
-    lines.append("\tvoice_keysplit_all voicegroup_rs_drumset")
+    lines.append(DRUMSET_LINE)
 
     # Emit chosen samples after that (starting at slot 1)
     for s in samples:
@@ -136,17 +158,19 @@ def write_voicegroup_file(
 
         if pad_with_square:
             # Safe placeholder patch: your common square line
-            pad_line = "\tvoice_square_1 60, 0, 0, 2, 0, 0, 15, 0"
-            lines.extend([pad_line] * remaining)
+            lines.extend([SQUARE_PAD_LINE] * remaining)
         else:
             # Or pad with repeats of first sample (valid)
-            pad_sym = samples[0].symbol if samples else "DirectSoundWaveData_sc88pro_flute"
+            pad_sym = samples[0].symbol if samples else FALLBACK_PAD_SYMBOL
             lines.extend(
                 [make_voice_directsound_line(pad_sym, key=key, pan=pan, a=a, b=b, c=c, d=d)] * remaining
             )
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    # Stream UTF-8 bytes through the default buffered writer instead of
+    # building one big joined string first.
+    with out_path.open("wb") as f:
+        f.writelines(line.encode("utf-8") + b"\n" for line in lines)
 
 
 def main() -> None:
@@ -172,7 +196,7 @@ def main() -> None:
         type=int,
         nargs=4,
         metavar=("A", "B", "C", "D"),
-        default=(255, 127, 231, 127),
+        default=DEFAULT_DS_PARAMS,
         help="DirectSound params (4 ints). Default is a common flute-like tuple.",
     )
     args = ap.parse_args()
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
-from dataclasses import dataclass, asdict
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
+
 
 # Matches DirectSoundWaveData_sc88pro_flute etc
 DS_SYMBOL_RE = re.compile(r"\b(DirectSoundWaveData_[A-Za-z0-9_]+)\b")
+# Bytes twin for scanning raw file buffers without decoding
+DS_SYMBOL_RE_B = re.compile(rb"\b(DirectSoundWaveData_[A-Za-z0-9_]+)\b")
+
+# Text-ish extensions worth scanning (lowercase, including the dot)
+TEXT_EXTS = frozenset({".inc", ".s", ".c", ".h", ".txt", ".cfg", ".json", ".asm"})
 
 
 @dataclass
@@ -21,25 +30,28 @@ class SampleEntry:
     sources: List[str]
 
 
+# One anchored pattern replaces the prefix-stripping loop: optional
+# DirectSoundWaveData_ prefix, optional bank prefix, rest is the base.
+# Alternation order matters (sc88pro before sc88, like the old loop).
+_SYMBOL_NORM_RE = re.compile(
+    r"^(?:DirectSoundWaveData_)?(?:(sc88pro|sc55|sc88|gm|gs|xg)_)?(.*)$"
+)
+
+
+# The same bank/base stems repeat across hundreds of symbols, so the three
+# normalization helpers are worth memoizing (inputs are plain strings).
+@lru_cache(maxsize=None)
 def normalize_symbol(symbol: str) -> Tuple[Optional[str], str]:
     """
     DirectSoundWaveData_sc88pro_nylon_str_guitar -> (bank="sc88pro", base="nylon_str_guitar")
     DirectSoundWaveData_flute -> (bank=None, base="flute")
     """
-    base = symbol.removeprefix("DirectSoundWaveData_")
-    bank = None
-
-    # common bank prefixes found in decomps (tweak freely)
-    for b in ("sc88pro", "sc55", "sc88", "gm", "gs", "xg"):
-        prefix = b + "_"
-        if base.startswith(prefix):
-            bank = b
-            base = base[len(prefix):]
-            break
-
-    return bank, base
+    m = _SYMBOL_NORM_RE.match(symbol)
+    assert m is not None  # pattern matches any string
+    return m.group(1), m.group(2)
 
 
+@lru_cache(maxsize=None)
 def pretty_name_from_base(base: str) -> str:
     """
     nylon_str_guitar -> Nylon String Guitar
@@ -71,9 +83,36 @@ def pretty_name_from_base(base: str) -> str:
     return " ".join(titled).strip()
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=None)
 def slugify(base: str) -> str:
     # stable id you can use in UI
-    return re.sub(r"[^a-z0-9]+", "-", base.lower()).strip("-")
+    return _SLUG_RE.sub("-", base.lower()).strip("-")
+
+
+def _scan_tree(top: str, paths: List[Path]) -> None:
+    # os.scandir gives us file type info from the dir entry itself (no extra
+    # stat per path like rglob + is_file does)
+    try:
+        entries = os.scandir(top)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    _scan_tree(entry.path, paths)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            name = entry.name
+            dot = name.rfind(".")
+            if dot > 0 and name[dot:].lower() in TEXT_EXTS:
+                paths.append(Path(entry.path))
 
 
 def iter_text_files(repo_root: Path) -> List[Path]:
@@ -81,28 +120,17 @@ def iter_text_files(repo_root: Path) -> List[Path]:
     Collect likely text-ish files to scan fast.
     You can expand extensions as needed.
     """
-    exts = {".inc", ".s", ".c", ".h", ".txt", ".cfg", ".json", ".asm"}
     paths: List[Path] = []
 
-    # Focus on sound first for speed, then fallback to whole repo if needed
+    # Focus on sound first for speed (the recursive walk already covers
+    # sound/voicegroups), then fallback to whole repo if needed
     sound_dir = repo_root / "sound"
     if sound_dir.exists():
-        for p in sound_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts:
-                paths.append(p)
-
-    # Also include voicegroups or other folders if they exist outside sound
-    vg_dir = repo_root / "sound" / "voicegroups"
-    if vg_dir.exists():
-        for p in vg_dir.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts and p not in paths:
-                paths.append(p)
+        _scan_tree(str(sound_dir), paths)
 
     # If nothing found, scan repo for those exts
     if not paths:
-        for p in repo_root.rglob("*"):
-            if p.is_file() and p.suffix.lower() in exts:
-                paths.append(p)
+        _scan_tree(str(repo_root), paths)
 
     return paths
 
@@ -114,23 +142,60 @@ def scan_directsound_symbols(repo_root: Path) -> Dict[str, Set[str]]:
     files = iter_text_files(repo_root)
     hits: Dict[str, Set[str]] = {}
 
+    # Relative paths via one precomputed prefix strip instead of
+    # Path.relative_to / is_relative_to per file
+    root_prefix = str(repo_root)
+    if not root_prefix.endswith(os.sep):
+        root_prefix += os.sep
+    prefix_len = len(root_prefix)
+
+    # Concatenate every file into one buffer (newline separators keep symbols
+    # from spanning file boundaries) and run the compiled scan exactly once,
+    # instead of a findall per file. Matches map back to their file by
+    # bisecting the cumulative end offsets.
+    chunks: List[bytes] = []
+    ends: List[int] = []
+    rels: List[str] = []
+    total = 0
     for p in files:
         try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
+            data = p.read_bytes()
         except Exception:
             continue
-
-        found = set(DS_SYMBOL_RE.findall(text))
-        if not found:
+        if not data:
             continue
-
-        rel = str(p.relative_to(repo_root)) if p.is_relative_to(repo_root) else str(p)
-        for sym in found:
-            hits.setdefault(sym, set()).add(rel)
+        chunks.append(data)
+        chunks.append(b"\n")
+        total += len(data) + 1
+        ends.append(total)
+        sp = str(p)
+        rels.append(sp[prefix_len:] if sp.startswith(root_prefix) else sp)
+
+    if not chunks:
+        return hits
+
+    buf = b"".join(chunks)
+
+    # Feed matches straight into the result map; the per-symbol source sets
+    # already dedupe, so no intermediate per-file set is needed. A tiny
+    # bytes->str memo avoids re-decoding repeated symbols.
+    decoded: Dict[bytes, str] = {}
+    for m in DS_SYMBOL_RE_B.finditer(buf):
+        raw = m.group(1)
+        sym = decoded.get(raw)
+        if sym is None:
+            sym = decoded[raw] = raw.decode("ascii")
+        hits.setdefault(sym, set()).add(rels[bisect_right(ends, m.start())])
 
     return hits
 
 
+def _entry_sort_key(e: SampleEntry) -> Tuple[str, str]:
+    # list.sort computes this once per entry; casefold is the proper
+    # caseless comparison form
+    return (e.name.casefold(), e.symbol.casefold())
+
+
 def build_entries(symbol_sources: Dict[str, Set[str]]) -> List[SampleEntry]:
     entries: List[SampleEntry] = []
     for sym, sources in symbol_sources.items():
@@ -147,7 +212,7 @@ def build_entries(symbol_sources: Dict[str, Set[str]]) -> List[SampleEntry]:
             )
         )
     # sort nicely by name then symbol
-    entries.sort(key=lambda e: (e.name.lower(), e.symbol.lower()))
+    entries.sort(key=_entry_sort_key)
     return entries
 
 
@@ -164,7 +229,7 @@ def main() -> None:
     out_obj = {
         "repo_root": str(repo_root),
         "directsound_count": len(entries),
-        "directsound": [asdict(e) for e in entries],
+        "directsound": entries,
         "synth_placeholders": [
             {"id": "square_wave", "name": "Square Wave"},
             {"id": "noise", "name": "Noise"},
@@ -173,7 +238,9 @@ def main() -> None:
         ],
     }
 
-    args.out.write_text(json.dumps(out_obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    # orjson serializes the dataclass entries directly and writes UTF-8
+    # bytes, so no asdict copies and no str -> bytes re-encode
+    args.out.write_bytes(orjson.dumps(out_obj, option=orjson.OPT_INDENT_2))
     print(f"Wrote {args.out} ({len(entries)} DirectSound samples).")
 
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import copy
+import heapq
+import re
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -12,6 +15,116 @@ from midi_editor.models import MidiProject
 from midi_editor.midi_io import load_midi_as_notes, save_project_to_midi
 from gui.ui_pianoroll import PianoRollView
 
+class _MidiLoadSignals(QtCore.QObject):
+    loaded = QtCore.Signal(object, object)  # (midi_path, MidiProject)
+    failed = QtCore.Signal(object, str)     # (midi_path, error text)
+
+
+class _MidiLoadTask(QtCore.QRunnable):
+    """Parses a MIDI file on a pool thread so the GUI stays responsive."""
+
+    def __init__(self, midi_path: Path):
+        super().__init__()
+        self.midi_path = midi_path
+        self.signals = _MidiLoadSignals()
+
+    def run(self) -> None:
+        try:
+            project = load_midi_as_notes(self.midi_path)
+        except Exception as e:
+            self.signals.failed.emit(self.midi_path, str(e))
+            return
+        self.signals.loaded.emit(self.midi_path, project)
+
+
+# Printable key text for the type-to-search buffer, matched by one
+# precompiled pattern instead of a per-keystroke str.isprintable call
+# (rejects control chars and keys with empty/whitespace-control text)
+_PRINTABLE_KEY_RE = re.compile(r"[^\x00-\x1f\x7f]+")
+
+
+class _PreviewSignals(QtCore.QObject):
+    failed = QtCore.Signal(str, str)  # (title, error text)
+    finished = QtCore.Signal()
+
+
+class _PreviewTask(QtCore.QRunnable):
+    """
+    Runs the preview pipeline off the GUI thread. The voicegroup generator
+    subprocess is started first and the MIDI init injection runs while it
+    works; both are independent, so they overlap instead of serializing.
+    """
+
+    def __init__(
+        self,
+        cwd: str,
+        in_mid: Path,
+        injected_mid: Path,
+        bpm: int,
+        gen_cmd: list[str],
+        prev_cmd: list[str],
+    ):
+        super().__init__()
+        self.cwd = cwd
+        self.in_mid = in_mid
+        self.injected_mid = injected_mid
+        self.bpm = bpm
+        self.gen_cmd = gen_cmd
+        self.prev_cmd = prev_cmd
+        self.signals = _PreviewSignals()
+
+    def run(self) -> None:
+        try:
+            self._run_pipeline()
+        finally:
+            self.signals.finished.emit()
+
+    def _run_pipeline(self) -> None:
+        try:
+            gen_proc = subprocess.Popen(
+                self.gen_cmd,
+                cwd=self.cwd,
+                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except OSError as e:
+            self.signals.failed.emit("Voicegroup generation failed", str(e))
+            return
+
+        try:
+            inject_init_events(
+                self.in_mid,
+                self.injected_mid,
+                tempo_bpm=self.bpm,
+                program_base=1,
+                max_melodic_channels=9,
+            )
+        except Exception as e:
+            gen_proc.kill()
+            gen_proc.wait()
+            self.signals.failed.emit("Preview failed", f"MIDI injection failed: {e}")
+            return
+
+        out, err = gen_proc.communicate()
+        if gen_proc.returncode != 0:
+            self.signals.failed.emit(
+                "Voicegroup generation failed", (err or out or "Unknown error").strip()
+            )
+            return
+
+        res = subprocess.run(
+            self.prev_cmd,
+            cwd=self.cwd,
+            text=True,
+            capture_output=True,
+        )
+        if res.returncode != 0:
+            self.signals.failed.emit(
+                "Preview failed", (res.stderr or res.stdout or "Unknown error").strip()
+            )
+
+
 class SearchableComboBox(QtWidgets.QComboBox):
     """
     Normal-looking combobox, but you can type to search.
@@ -34,23 +147,65 @@ class SearchableComboBox(QtWidgets.QComboBox):
         self._reset_timer.setSingleShot(True)
         self._reset_timer.timeout.connect(self._reset_search)
 
-        comp = QtWidgets.QCompleter(self)
-        comp.setModel(self.model())
+        # One persistent case-insensitive "contains" proxy over the combo's
+        # model; keystrokes only update its filter string instead of letting
+        # QCompleter re-match the whole list per key.
+        self._proxy = QtCore.QSortFilterProxyModel(self)
+        self._proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self._proxy.setSourceModel(self.model())
+
+        comp = QtWidgets.QCompleter(self._proxy, self)
         comp.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        comp.setFilterMode(QtCore.Qt.MatchContains)
-        comp.setCompletionMode(QtWidgets.QCompleter.PopupCompletion)
+        # The proxy already filters, so the popup shows it unfiltered
+        comp.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
         comp.activated[str].connect(self._on_completer_activated)
         self.setCompleter(comp)
 
+        # label -> first index, built lazily and dropped whenever the model
+        # changes, so completer activation is a dict hit instead of findText
+        self._text_index: Optional[dict[str, int]] = None
+        self._watch_model(self.model())
+
+    def _watch_model(self, model) -> None:
+        model.rowsInserted.connect(self._invalidate_text_index)
+        model.rowsRemoved.connect(self._invalidate_text_index)
+        model.modelReset.connect(self._invalidate_text_index)
+        model.dataChanged.connect(self._invalidate_text_index)
+        model.layoutChanged.connect(self._invalidate_text_index)
+
+    def _invalidate_text_index(self, *args) -> None:
+        self._text_index = None
+
+    def setModel(self, model) -> None:
+        super().setModel(model)
+        # Keep the search proxy pointed at whatever model the combo uses
+        # (guard: QComboBox may call setModel during construction)
+        if hasattr(self, "_proxy"):
+            self._proxy.setSourceModel(model)
+            # QComboBox.setModel re-points the line-edit completer at the raw
+            # model; put it back on the proxy or type-to-search stops filtering
+            comp = self.completer()
+            if comp:
+                comp.setModel(self._proxy)
+        if hasattr(self, "_text_index"):
+            self._text_index = None
+            self._watch_model(model)
+
     def _reset_search(self) -> None:
         self._search = ""
+        self._proxy.setFilterFixedString("")
         c = self.completer()
         if c:
-            c.setCompletionPrefix("")
             c.popup().hide()
 
     def _on_completer_activated(self, text: str) -> None:
-        idx = self.findText(text, QtCore.Qt.MatchExactly)
+        index = self._text_index
+        if index is None:
+            index = {}
+            for i in range(self.count()):
+                index.setdefault(self.itemText(i), i)  # first match wins, like findText
+            self._text_index = index
+        idx = index.get(text, -1)
         if idx >= 0:
             self.setCurrentIndex(idx)
         self._reset_search()
@@ -81,18 +236,17 @@ class SearchableComboBox(QtWidgets.QComboBox):
             self._search = self._search[:-1]
         elif txt and not event.modifiers() & (QtCore.Qt.ControlModifier | QtCore.Qt.AltModifier | QtCore.Qt.MetaModifier):
             # Add printable chars
-            if txt.isprintable():
+            if _PRINTABLE_KEY_RE.fullmatch(txt):
                 self._search += txt
 
         if not self._search:
             super().keyPressEvent(event)
             return
 
-        # Show completer popup with "contains" matching
+        # Narrow the proxy and show the popup with "contains" matching
+        self._proxy.setFilterFixedString(self._search)
         c = self.completer()
         if c:
-            c.setCompletionPrefix(self._search)
-            # Ensure popup shows something useful
             c.complete()
 
         # Reset buffer after a short pause
@@ -106,6 +260,41 @@ class MainWindow(QtWidgets.QMainWindow):
         self.project: Optional[MidiProject] = None
         self.current_midi_path: Optional[Path] = None
 
+        # in-flight background MIDI load (keeps its signals object alive)
+        self._load_task: Optional[_MidiLoadTask] = None
+
+        # in-flight preview pipeline (also a re-entry guard)
+        self._preview_task: Optional[_PreviewTask] = None
+
+        # Instrument display labels and label<->id maps are fixed for the
+        # lifetime of the config, so build them once here instead of on
+        # every channel-table refresh.
+        self._instrument_labels: list[str] = []
+        self._id_by_label: dict[str, int] = {}
+        self._label_by_id: dict[int, str] = {}
+        self._name_by_id: dict[int, str] = {}
+        for inst in cfg.instruments:
+            label = f"{inst.name} [{inst.bank}]" if inst.bank else inst.name
+            self._instrument_labels.append(label)
+            self._id_by_label[label] = inst.id
+            self._label_by_id[inst.id] = label
+            self._name_by_id[inst.id] = inst.name
+
+        # One shared label model for every instrument combo (and its
+        # completer); rows attach to it instead of copying the label list
+        self._instrument_label_model = QtCore.QStringListModel(self._instrument_labels, self)
+
+        # channel -> mute checkbox for the current table rows, so reading the
+        # mute state doesn't rescan cell widgets row by row
+        self._mute_checkbox_by_channel: dict[int, QtWidgets.QCheckBox] = {}
+
+        # 0 ms single-shot timer coalescing bursts of refresh_channel_table
+        # calls (e.g. remap + redraw paths) into one rebuild per event loop
+        self._refresh_table_timer = QtCore.QTimer(self)
+        self._refresh_table_timer.setSingleShot(True)
+        self._refresh_table_timer.setInterval(0)
+        self._refresh_table_timer.timeout.connect(self._refresh_channel_table_now)
+
         self.setWindowTitle("MIDI Editor (Preview + Export)")
         self.resize(1200, 700)
 
@@ -206,7 +395,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_merge.clicked.connect(self.merge_channels_dialog)
         self.btn_preview.clicked.connect(self.preview_full_song)
         self.btn_export.clicked.connect(self.export_assets_dialog)
-        self.channel_table.cellChanged.connect(self.on_channel_cell_changed)
+        # cellChanged is connected after each rebuild (see
+        # _refresh_channel_table_now) so population doesn't queue slot calls
 
         # Keybind for deleting notes
         delete_shortcut = QtWidgets.QShortcut(QtCore.Qt.Key_Delete, self)
@@ -502,25 +692,20 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "Manual Remap Drums", "No changes selected.")
             return
 
-        # Apply delete first
-        if delete_set:
-            self.project.notes = [
-                n for n in self.project.notes
-                if not (n.channel == 9 and int(n.pitch) in delete_set)
-            ]
-
-        # Apply remap
+        # Apply deletes and remaps in one fused pass over the notes
         changed = 0
+        kept: list = []
         for n in self.project.notes:
-            if n.channel != 9:
-                continue
-            old = int(n.pitch)
-            new = remap_map.get(old)
-            if new is None:
-                continue
-            if int(new) != old:
-                n.pitch = int(new)
-                changed += 1
+            if n.channel == 9:
+                old = int(n.pitch)
+                if old in delete_set:
+                    continue
+                new = remap_map.get(old)
+                if new is not None and int(new) != old:
+                    n.pitch = int(new)
+                    changed += 1
+            kept.append(n)
+        self.project.notes = kept
 
         self.pianoroll.redraw()
         self.refresh_channel_table()
@@ -546,15 +731,40 @@ class MainWindow(QtWidgets.QMainWindow):
             self.refresh_channel_table()
 
     def open_midi(self) -> None:
+        # One load at a time, same guard as preview_full_song: otherwise two
+        # in-flight tasks race and whichever finishes last wins the project
+        if self._load_task is not None:
+            return
+
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Open MIDI", "", "MIDI Files (*.mid *.midi)"
         )
         if not path:
             return
 
-        midi_path = Path(path)
+        # Parse on the global thread pool; _on_midi_loaded finishes on the
+        # GUI thread via the queued signal.
+        task = _MidiLoadTask(Path(path))
+        task.signals.loaded.connect(self._on_midi_loaded)
+        task.signals.failed.connect(self._on_midi_load_failed)
+        self._load_task = task  # keep the signals object alive until done
+        if self.statusBar():
+            self.statusBar().showMessage(f"Loading {path}…")
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_midi_load_failed(self, midi_path: Path, error: str) -> None:
+        self._load_task = None
+        if self.statusBar():
+            self.statusBar().clearMessage()
+        QtWidgets.QMessageBox.critical(self, "Open MIDI", f"Failed to load {midi_path}:\n{error}")
+
+    def _on_midi_loaded(self, midi_path: Path, project: MidiProject) -> None:
+        self._load_task = None
+        if self.statusBar():
+            self.statusBar().clearMessage()
+
         self.current_midi_path = midi_path
-        self.project = load_midi_as_notes(midi_path)
+        self.project = project
 
         # Populate BPM from imported MIDI tempo (or default)
         self.spin_bpm.setValue(int(getattr(self.project, "tempo_bpm", 120)))
@@ -581,17 +791,33 @@ class MainWindow(QtWidgets.QMainWindow):
         c.setHsv(hue, 140, 220)
         return c
 
+    def _swatch_pixmap(self, ch: int) -> QtGui.QPixmap:
+        # Qt's global pixmap cache keeps the rendered swatches in graphics
+        # memory across table rebuilds (and evicts under pressure for free)
+        key = f"chswatch:{ch}"
+        pm = QtGui.QPixmapCache.find(key)
+        if pm is None:
+            pm = QtGui.QPixmap(12, 12)
+            pm.fill(self._color_for_channel(ch))
+            painter = QtGui.QPainter(pm)
+            painter.setPen(QtGui.QColor(0x44, 0x44, 0x44))
+            painter.drawRect(0, 0, 11, 11)
+            painter.end()
+            QtGui.QPixmapCache.insert(key, pm)
+        return pm
+
     def _channel_cell_widget(self, ch: int) -> QtWidgets.QWidget:
         w = QtWidgets.QWidget()
+        # selected_channel reads this back instead of digging through
+        # child labels for digit text
+        w.setProperty("channel", ch)
         lay = QtWidgets.QHBoxLayout(w)
         lay.setContentsMargins(0, 0, 0, 0)
         lay.setSpacing(6)
 
         swatch = QtWidgets.QLabel()
         swatch.setFixedSize(12, 12)
-        swatch.setStyleSheet(
-            f"background-color: {self._color_for_channel(ch).name()}; border: 1px solid #444;"
-        )
+        swatch.setPixmap(self._swatch_pixmap(ch))
 
         lbl = QtWidgets.QLabel(str(ch))
         lbl.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
@@ -631,7 +857,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         assert self.project is not None
 
-        muted = self._muted_channels_from_table()
+        # frozenset: immutable, hashed once, and the per-note membership test
+        # below is the hot check of this copy
+        muted = frozenset(self._muted_channels_from_table())
 
         # Keep project.muted_channels in sync for future use/debugging
         try:
@@ -639,28 +867,14 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
-        filtered_notes = []
-        for n in self.project.notes:
-            if n.channel in muted:
-                continue
-            filtered_notes.append(type(n)(
-                start_tick=n.start_tick,
-                end_tick=n.end_tick,
-                pitch=n.pitch,
-                velocity=n.velocity,
-                channel=n.channel,
-                track_index=getattr(n, "track_index", 0),
-            ))
-
-        return MidiProject(
-            ticks_per_beat=self.project.ticks_per_beat,
-            notes=filtered_notes,
-            channel_instrument_id=dict(self.project.channel_instrument_id),
-            tempo_bpm=int(getattr(self.project, "tempo_bpm", 120)),
-            channel_track_name=dict(getattr(self.project, "channel_track_name", {})),
-            muted_channels=set(muted),
-        )
-
+        # copy.copy clones the note in one C-level call instead of re-running
+        # the dataclass constructor field by field. With nothing muted the
+        # membership test is dead weight, so skip it for the common case.
+        notes = self.project.notes
+        if muted:
+            filtered_notes = [copy.copy(n) for n in notes if n.channel not in muted]
+        else:
+            filtered_notes = [copy.copy(n) for n in notes]
 
         return MidiProject(
             ticks_per_beat=self.project.ticks_per_beat,
@@ -671,41 +885,50 @@ class MainWindow(QtWidgets.QMainWindow):
             muted_channels=set(muted),
         )
 
-    def _channel_number_from_row(self, row: int) -> Optional[int]:
-        w = self.channel_table.cellWidget(row, 0)
-        if not w:
-            return None
-        for lbl in w.findChildren(QtWidgets.QLabel):
-            t = lbl.text().strip()
-            if t.isdigit():
-                return int(t)
-        return None
-
-
     def _muted_channels_from_table(self) -> set[int]:
-        muted: set[int] = set()
-        for row in range(self.channel_table.rowCount()):
-            cb = self.channel_table.cellWidget(row, 1)
-            if not isinstance(cb, QtWidgets.QCheckBox):
-                continue
-            if not cb.isChecked():
-                continue
-            ch = self._channel_number_from_row(row)
-            if ch is not None:
-                muted.add(ch)
-        return muted
+        # The checkbox cache is rebuilt with the table, so this avoids the
+        # old per-row cellWidget + label-scan walk
+        return {ch for ch, cb in self._mute_checkbox_by_channel.items() if cb.isChecked()}
 
 
     def refresh_channel_table(self) -> None:
+        # Debounced: repeated calls within one event-loop turn collapse into
+        # a single rebuild when the 0 ms timer fires.
+        self._refresh_table_timer.start()
+
+    def _refresh_channel_table_now(self) -> None:
+        # Suspend repaints while the table is rebuilt so Qt lays the rows out
+        # once at the end instead of relayouting per cell/widget insert.
+        self.channel_table.setUpdatesEnabled(False)
         self.channel_table.blockSignals(True)
+
+        # Detach cellChanged entirely during population; blockSignals alone
+        # doesn't stop item mutations from queueing slot calls
+        try:
+            self.channel_table.cellChanged.disconnect(self.on_channel_cell_changed)
+        except TypeError:
+            pass
+
+        try:
+            self._rebuild_channel_table()
+        finally:
+            self.channel_table.blockSignals(False)
+            self.channel_table.setUpdatesEnabled(True)
+            self.channel_table.cellChanged.connect(self.on_channel_cell_changed)
+
+    def _rebuild_channel_table(self) -> None:
         self.channel_table.setRowCount(0)
+        self._mute_checkbox_by_channel.clear()
 
         if not self.project:
             self.lbl_warning.setText("")
-            self.channel_table.blockSignals(False)
             return
 
-        used = self.project.used_channels()
+        # One O(N) pass gives both the counts and the used-channel list;
+        # track names are already a dict keyed by channel
+        note_counts = self.project.note_counts_by_channel()
+        used = sorted(note_counts)
+        track_names = getattr(self.project, "channel_track_name", {}) or {}
         has_overflow = any(c > 9 for c in used)
 
         warning_lines: list[str] = []
@@ -715,26 +938,19 @@ class MainWindow(QtWidgets.QMainWindow):
 
         instruments = self.cfg.instruments
 
-        # Build display labels once per refresh
-        display_labels: list[str] = []
-        id_by_label: dict[str, int] = {}
-        label_by_id: dict[int, str] = {}
-
-        for inst in instruments:
-            label = f"{inst.name} [{inst.bank}]" if inst.bank else inst.name
-            display_labels.append(label)
-            id_by_label[label] = inst.id
-            label_by_id[inst.id] = label
+        # Labels and maps are precompiled in __init__ and shared across rows
+        display_labels = self._instrument_labels
+        label_by_id = self._label_by_id
 
         default_inst_id = instruments[0].id if instruments else 0
         default_label = display_labels[0] if display_labels else "No instruments loaded"
 
         muted = getattr(self.project, "muted_channels", set()) or set()
 
-        for ch in used:
-            row = self.channel_table.rowCount()
-            self.channel_table.insertRow(row)
+        # Allocate all rows in one go instead of growing the table per channel
+        self.channel_table.setRowCount(len(used))
 
+        for row, ch in enumerate(used):
             # Column 0: Channel + color swatch
             self.channel_table.setCellWidget(row, 0, self._channel_cell_widget(ch))
 
@@ -746,10 +962,11 @@ class MainWindow(QtWidgets.QMainWindow):
             mute.blockSignals(False)
             mute.stateChanged.connect(self._on_mute_changed)
             self.channel_table.setCellWidget(row, 1, mute)
+            self._mute_checkbox_by_channel[ch] = mute
 
             # Column 2: Role + imported track label
             role = "Drums" if ch == 9 else "Melodic"
-            trk_label = (getattr(self.project, "channel_track_name", {}).get(ch) or "").strip()
+            trk_label = (track_names.get(ch) or "").strip()
             if trk_label:
                 role = f"{role} ({trk_label})"
             item_role = QtWidgets.QTableWidgetItem(role)
@@ -758,12 +975,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
             # Column 3: Instrument combo (normal-looking, type-to-search)
             if ch == 9:
-                combo = QtWidgets.QComboBox()
-                combo.addItem("Drums (channel 9)")
-                combo.setEnabled(False)
+                # Fixed text, so a plain item is enough: no combo widget,
+                # model or view allocated for the drum row
+                item_drums = QtWidgets.QTableWidgetItem("Drums (channel 9)")
+                item_drums.setFlags(item_drums.flags() & ~QtCore.Qt.ItemIsEditable)
+                self.channel_table.setItem(row, 3, item_drums)
             else:
                 combo = SearchableComboBox()
-                combo.addItems(display_labels)
+                # Attach the shared label model: no per-row item copies, and
+                # the combo's search proxy follows it automatically
+                combo.setModel(self._instrument_label_model)
 
                 # Ensure we have a selection stored for this channel
                 self.project.channel_instrument_id.setdefault(ch, default_inst_id)
@@ -774,29 +995,44 @@ class MainWindow(QtWidgets.QMainWindow):
                 combo.setCurrentText(label_by_id.get(current_id, default_label))
                 combo.blockSignals(False)
 
-                # Update mapping when selection changes
-                def _on_changed(label: str, ch=ch) -> None:
-                    inst_id = id_by_label.get(label)
-                    if inst_id is None:
-                        return
-                    self.set_channel_instrument_id(ch, inst_id)
-
-                combo.currentTextChanged.connect(_on_changed)
-
-            self.channel_table.setCellWidget(row, 3, combo)
+                # Update mapping when selection changes (shared slot, channel
+                # carried as a widget property like the mute checkboxes)
+                combo.setProperty("channel", ch)
+                combo.currentTextChanged.connect(self._on_instrument_changed)
+                self.channel_table.setCellWidget(row, 3, combo)
 
             # Column 4: Notes count
-            ncount = len(self.project.notes_for_channel(ch))
+            ncount = note_counts.get(ch, 0)
             item_notes = QtWidgets.QTableWidgetItem(str(ncount))
             item_notes.setFlags(item_notes.flags() & ~QtCore.Qt.ItemIsEditable)
             self.channel_table.setItem(row, 4, item_notes)
 
-        self.channel_table.blockSignals(False)
+    def _on_instrument_changed(self, label: str) -> None:
+        """
+        Stable slot: reads channel from sender().property("channel").
+        Avoids rebuilding a closure per row on every table refresh.
+        """
+        if not self.project:
+            return
+        combo = self.sender()
+        if not isinstance(combo, QtWidgets.QComboBox):
+            return
+        ch = combo.property("channel")
+        if not isinstance(ch, int):
+            return
+        inst_id = self._id_by_label.get(label)
+        if inst_id is None:
+            return
+        self.set_channel_instrument_id(ch, inst_id)
 
     def set_channel_instrument_id(self, ch: int, inst_id: int) -> None:
         if not self.project or ch == 9:
             return
-        self.project.channel_instrument_id[ch] = int(inst_id)
+        inst_id = int(inst_id)
+        # Combos re-emit on table rebuilds; skip writes that change nothing
+        if self.project.channel_instrument_id.get(ch) == inst_id:
+            return
+        self.project.channel_instrument_id[ch] = inst_id
 
     def on_channel_cell_changed(self, row: int, col: int) -> None:
         pass
@@ -810,12 +1046,8 @@ class MainWindow(QtWidgets.QMainWindow):
         w = self.channel_table.cellWidget(row, 0)
         if not w:
             return None
-        labels = w.findChildren(QtWidgets.QLabel)
-        for lbl in labels:
-            txt = lbl.text().strip()
-            if txt.isdigit():
-                return int(txt)
-        return None
+        ch = w.property("channel")
+        return ch if isinstance(ch, int) else None
 
     def build_pick_names_for_channels_0_8(self) -> list[str]:
         assert self.project is not None
@@ -823,7 +1055,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not instruments:
             return [""] * 9
 
-        name_by_id = {inst.id: inst.name for inst in instruments}
+        name_by_id = self._name_by_id  # precompiled in __init__
         default_id = instruments[0].id
 
         picks: list[str] = []
@@ -930,11 +1162,9 @@ class MainWindow(QtWidgets.QMainWindow):
         return True
 
     def preview_full_song(self) -> None:
-        if not self.project:
+        if not self.project or self._preview_task is not None:
             return
 
-        self.cfg.resources_midi_dir.mkdir(parents=True, exist_ok=True)
-
         proj_out = self._filtered_project_copy()
 
         warnings = save_project_to_midi(
@@ -958,14 +1188,6 @@ class MainWindow(QtWidgets.QMainWindow):
         injected_mid = self.cfg.resources_midi_dir / "mus_preview_init.mid"
         bpm = int(self.spin_bpm.value())
 
-        inject_init_events(
-            Path(self.cfg.temp_preview_midi_path),
-            Path(injected_mid),
-            tempo_bpm=bpm,
-            program_base=1,
-            max_melodic_channels=9,
-        )
-
         picks = self.build_pick_names_for_channels_0_8()
 
         voicegroup_name = "test"
@@ -983,9 +1205,6 @@ class MainWindow(QtWidgets.QMainWindow):
             gen_cmd += ["--pick", p]
         gen_cmd += ["--pad", "--pad-with-square", "--out", str(inc_out)]
 
-        if not self._run_cmd(gen_cmd, "Voicegroup generation failed"):
-            return
-
         vol = int(self.spin_volume.value())
         rev = int(self.spin_reverb.value())
         pri = int(self.spin_priority.value())
@@ -1009,15 +1228,35 @@ class MainWindow(QtWidgets.QMainWindow):
             str(pri),
         ]
 
-        self._run_cmd(prev_cmd, "Preview failed")
+        # Everything left is subprocess/file work; hand it to the pool so
+        # the GUI stays responsive while the song builds and launches
+        task = _PreviewTask(
+            cwd=str(self.cfg.project_root),
+            in_mid=Path(self.cfg.temp_preview_midi_path),
+            injected_mid=Path(injected_mid),
+            bpm=bpm,
+            gen_cmd=gen_cmd,
+            prev_cmd=prev_cmd,
+        )
+        task.signals.failed.connect(self._on_preview_failed)
+        task.signals.finished.connect(self._on_preview_finished)
+        self._preview_task = task
+        self.btn_preview.setEnabled(False)
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_preview_failed(self, title: str, msg: str) -> None:
+        QtWidgets.QMessageBox.critical(self, title, msg)
+
+    def _on_preview_finished(self) -> None:
+        self._preview_task = None
+        self.btn_preview.setEnabled(True)
 
     def auto_remap_drums(self) -> None:
         if not self.project:
             return
 
         # If no channel 9 notes, no-op
-        has_drums = any(n.channel == 9 for n in self.project.notes)
-        if not has_drums:
+        if not self.project.has_channel(9):
             QtWidgets.QMessageBox.information(self, "Auto Remap Drums", "No notes found on channel 9.")
             return
 
@@ -1044,37 +1283,27 @@ class MainWindow(QtWidgets.QMainWindow):
         if unmapped:
             mapping = self._prompt_unmapped_drums(unmapped)
             if mapping:
-                # 1) Delete requests
-                delete_pitches = {int(k) for k, v in mapping.items() if v == "__DELETE__"}
-                if delete_pitches:
-                    before = len(self.project.notes)
-                    self.project.notes = [
-                        n for n in self.project.notes
-                        if not (n.channel == 9 and int(n.pitch) in delete_pitches)
-                    ]
-                    deleted_manual = before - len(self.project.notes)
-
-                # 2) Remap requests
+                # Apply deletes + remaps and recompute what is still
+                # unmapped in a single pass over the notes
+                rs_valid = {int(k) for k in self.cfg.drums_by_note.keys()}
+                unmapped = set()
+                kept: list = []
                 for n in self.project.notes:
-                    if n.channel != 9:
-                        continue
-                    old = int(n.pitch)
-                    new = mapping.get(old)
-                    if new is None or new == "__DELETE__":
-                        continue
-                    new_i = int(new)
-                    if new_i != old:
-                        n.pitch = new_i
-                        changed_manual += 1
-
-                # 3) Recompute unmapped after manual changes:
-                # pitches still not in RS drumset
-                rs_valid = set(int(k) for k in self.cfg.drums_by_note.keys())
-                unmapped = {
-                    int(n.pitch)
-                    for n in self.project.notes
-                    if n.channel == 9 and int(n.pitch) not in rs_valid
-                }
+                    if n.channel == 9:
+                        old = int(n.pitch)
+                        new = mapping.get(old)
+                        if new == "__DELETE__":
+                            deleted_manual += 1
+                            continue
+                        if new is not None:
+                            new_i = int(new)
+                            if new_i != old:
+                                n.pitch = new_i
+                                changed_manual += 1
+                        if int(n.pitch) not in rs_valid:
+                            unmapped.add(int(n.pitch))
+                    kept.append(n)
+                self.project.notes = kept
 
         self.pianoroll.redraw()
         self.refresh_channel_table()
@@ -1088,15 +1317,15 @@ class MainWindow(QtWidgets.QMainWindow):
             msg.append(f"Manual deleted notes: {deleted_manual}")
 
         if unmapped:
-            show = sorted(list(unmapped))[:24]
-            pretty = []
-            for p in show:
-                nm = GM_NOTE_TO_NAME.get(int(p))
-                pretty.append(f"{p} ({nm})" if nm else str(p))
+            # nsmallest: O(N) for the 24 we show, no full sorted copy
+            show = heapq.nsmallest(24, unmapped)
+            def _pretty(p: int) -> str:
+                nm = GM_NOTE_TO_NAME.get(p)
+                return f"{p} ({nm})" if nm else str(p)
 
             msg.append("")
             msg.append("Unmapped drum pitches (left unchanged):")
-            msg.append(", ".join(pretty))
+            msg.append(", ".join(_pretty(p) for p in show))
             if len(unmapped) > len(show):
                 msg.append(f"... and {len(unmapped) - len(show)} more.")
 
@@ -56,6 +56,12 @@ class PianoRollView(QtWidgets.QGraphicsView):
         self.project: Optional[MidiProject] = None
         self.drums_by_note = drums_by_note
 
+        self._grid_pen = QtGui.QPen(QtGui.QColor(230, 230, 230))
+
+        # 16 channels -> 16 colors, built once; redraw indexes this instead
+        # of constructing a QColor per note
+        self._channel_colors = tuple(self._make_channel_color(ch) for ch in range(16))
+
         self._scene.selectionChanged.connect(self.selection_changed)
 
         # Small UX: let the view accept focus so keybinds work reliably
@@ -65,7 +71,8 @@ class PianoRollView(QtWidgets.QGraphicsView):
         self.project = project
         self.redraw()
 
-    def _color_for_channel(self, ch: int) -> QtGui.QColor:
+    @staticmethod
+    def _make_channel_color(ch: int) -> QtGui.QColor:
         # Drums
         if ch == 9:
             return QtGui.QColor(220, 200, 120)
@@ -76,6 +83,9 @@ class PianoRollView(QtWidgets.QGraphicsView):
         c.setHsv(hue, 140, 220)
         return c
 
+    def _color_for_channel(self, ch: int) -> QtGui.QColor:
+        return self._channel_colors[ch]
+
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         mods = event.modifiers()
         delta = event.angleDelta().y()
@@ -136,6 +146,40 @@ class PianoRollView(QtWidgets.QGraphicsView):
         if isinstance(mw, QtWidgets.QMainWindow) and mw.statusBar():
             mw.statusBar().showMessage(text, 8000)
 
+    def viewportEvent(self, event: QtCore.QEvent) -> bool:
+        # Tooltips are resolved lazily here instead of formatting and storing
+        # an info string on every item during redraw
+        if event.type() == QtCore.QEvent.ToolTip:
+            item = self._note_item_at_view_pos(event.pos())
+            if item:
+                QtWidgets.QToolTip.showText(event.globalPos(), self._note_info_text(item.note), self)
+            else:
+                QtWidgets.QToolTip.hideText()
+            return True
+        return super().viewportEvent(event)
+
+    def drawBackground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
+        # Paint the pitch grid directly for the exposed rect instead of
+        # keeping ~73 QGraphicsLineItems in the scene per redraw
+        super().drawBackground(painter, rect)
+        if not self.project or not self.project.notes:
+            return
+
+        m = self.metrics
+        key_px = m.key_px
+        max_row = m.pitch_max - m.pitch_min
+
+        first = max(0, int(rect.top() // key_px))
+        last = min(max_row, int(rect.bottom() // key_px))
+        if last < first:
+            return
+
+        x1 = rect.left()
+        x2 = rect.right()
+        lines = [QtCore.QLineF(x1, i * key_px, x2, i * key_px) for i in range(first, last + 1)]
+        painter.setPen(self._grid_pen)
+        painter.drawLines(lines)
+
     def redraw(self) -> None:
         self._scene.clear()
         if not self.project:
@@ -151,29 +195,38 @@ class PianoRollView(QtWidgets.QGraphicsView):
         height = (m.pitch_max - m.pitch_min + 1) * m.key_px + 40
         self._scene.setSceneRect(0, 0, width, height)
 
-        # Grid lines
-        grid_pen = QtGui.QPen(QtGui.QColor(230, 230, 230))
-        for p in range(m.pitch_min, m.pitch_max + 1):
-            y = (m.pitch_max - p) * m.key_px
-            self._scene.addLine(0, y, width, y, grid_pen)
-
-        # Notes
+        # Grid lines are painted in drawBackground, not added as scene items
+
+        # Notes. Hoist metrics and bound methods out of the loop, and skip
+        # BSP index maintenance while items stream in (rebuilt once below) —
+        # for dense MIDIs the per-note Python overhead dominates redraw time.
+        scene = self._scene
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        tick_px = m.tick_px
+        key_px = m.key_px
+        pitch_min = m.pitch_min
+        pitch_max = m.pitch_max
+        color_for = self._color_for_channel
+        add_item = scene.addItem
+        rectf = QtCore.QRectF
         for n in notes:
-            if n.pitch < m.pitch_min or n.pitch > m.pitch_max:
+            pitch = n.pitch
+            if pitch < pitch_min or pitch > pitch_max:
                 continue
 
-            x = n.start_tick * m.tick_px
-            w = max(1.0, (n.end_tick - n.start_tick) * m.tick_px)
-            y = (m.pitch_max - n.pitch) * m.key_px
-            h = m.key_px
-
-            color = self._color_for_channel(n.channel)
-            item = NoteItem(n, QtCore.QRectF(x, y, w, h), color)
-
-            # Tooltip: include note name + drum sample if ch9
-            item.setToolTip(self._note_info_text(n))
+            start = n.start_tick
+            w = (n.end_tick - start) * tick_px
+            if w < 1.0:
+                w = 1.0
 
-            self._scene.addItem(item)
+            add_item(
+                NoteItem(
+                    n,
+                    rectf(start * tick_px, (pitch_max - pitch) * key_px, w, key_px),
+                    color_for(n.channel),
+                )
+            )
+        scene.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
 
     def delete_selected_notes(self) -> int:
         if not self.project:
@@ -182,9 +235,11 @@ class PianoRollView(QtWidgets.QGraphicsView):
         if not selected_items:
             return 0
 
-        selected_notes = {it.note for it in selected_items}
+        # Identity keys: NoteEvent has no stable hash/eq of its own, and id()
+        # membership makes the filter a plain O(N) pass
+        selected_ids = {id(it.note) for it in selected_items}
         before = len(self.project.notes)
-        self.project.notes = [n for n in self.project.notes if n not in selected_notes]
+        self.project.notes = [n for n in self.project.notes if id(n) not in selected_ids]
         removed = before - len(self.project.notes)
         self.redraw()
         return removed
@@ -17,17 +17,19 @@ def inject_init_events(
     if len(mid.tracks) == 0:
         mid.tracks.append(mido.MidiTrack())
 
-    # 1) Inject TEMPO at absolute time 0 into track 0
-    tempo_msg = mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(tempo_bpm), time=0)
-    mid.tracks[0].insert(0, tempo_msg)
-
-    # 2) Inject Program Change for channels 0..8 at time 0 into track 0
+    # 1) TEMPO at absolute time 0, then Program Changes for channels 0..8.
     # This is simplest and most compatible with converters that scan global events.
     # Program mapping: ch0->1, ch1->2 ... ch8->9
+    inserts: list = [
+        mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(tempo_bpm), time=0)
+    ]
     for ch in range(max_melodic_channels):
         prog = program_base + ch
-        pc = mido.Message("program_change", channel=ch, program=prog, time=0)
-        mid.tracks[0].insert(1 + ch, pc)
+        inserts.append(mido.Message("program_change", channel=ch, program=prog, time=0))
+
+    # One slice assignment shifts the existing track tail once, instead of
+    # O(track) element moves per insert
+    mid.tracks[0][:0] = inserts
 
     # 3) Safety: if any note_on at time 0 appears before these inserts within track 0,
     # inserting at the start already guarantees init comes first in track 0.
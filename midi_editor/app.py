@@ -63,6 +63,9 @@ def main() -> int:
         db_path=db_path,
     )
 
+    # Ensure the preview output folder exists once here instead of per preview
+    cfg.resources_midi_dir.mkdir(parents=True, exist_ok=True)
+
     app = QtWidgets.QApplication(sys.argv)
     w = MainWindow(cfg)
     w.show()
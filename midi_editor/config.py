@@ -1,7 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
-import json
+
+import orjson
 
 
 @dataclass(frozen=True)
@@ -36,20 +37,16 @@ class AppConfig:
     def resources_dir(self) -> Path:
         return self.project_root / "resources"
 
-    @property
-    def temp_preview_midi_path(self) -> Path:
-        return self.resources_dir / "mus_preview.mid"
-
     @property
     def resources_midi_dir(self) -> Path:
-        return self.project_root / "resources" / "midi" 
+        return self.project_root / "resources" / "midi"
 
     @property
     def temp_preview_midi_path(self) -> Path:
         return self.resources_midi_dir / "mus_preview.mid"
 
 def load_directsound_samples_json(path: Path) -> list[InstrumentDef]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
 
     # Your file is a top-level list: [ {id, name, ...}, ... ]
     if isinstance(data, list):
@@ -75,7 +72,7 @@ def load_directsound_samples_json(path: Path) -> list[InstrumentDef]:
 
 
 def load_runtime_config_json(path: Path) -> dict[str, str]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
 
     # You said your JSON has repo, mgba, db keys.
     # We resolve relative paths relative to project root in app.py (below).
@@ -87,7 +84,7 @@ def load_runtime_config_json(path: Path) -> dict[str, str]:
 
 
 def load_rs_drums_json(path: Path) -> dict[int, DrumDef]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
     notes = data.get("notes", [])
     out: dict[int, DrumDef] = {}
     for item in notes:
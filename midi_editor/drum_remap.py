@@ -32,10 +32,14 @@ GM_NOTE_TO_CATEGORY: Dict[int, str] = {
 }
 
 
+# Compiled once at import; _norm runs on every drumset entry
+_RE_PAREN = re.compile(r"\([^)]*\)")
+_RE_NONALNUM = re.compile(r"[^a-z0-9]+")
+
+
 def _norm(s: str) -> str:
-    s = s.lower().strip()
-    s = re.sub(r"\([^)]*\)", "", s)
-    s = re.sub(r"[^a-z0-9]+", " ", s)
+    s = _RE_PAREN.sub("", s.lower().strip())
+    s = _RE_NONALNUM.sub(" ", s)
     return " ".join(s.split())
 
 
@@ -105,6 +109,31 @@ def _build_gm_to_rs(rs_drums_by_note: Dict[Any, Any]) -> Dict[int, int]:
     return gm_to_rs
 
 
+# One-entry memo for the derived remap tables. The drumset dict is loaded
+# once at startup and never mutated, so identity of the source dict is a
+# safe cache key; holding the strong reference keeps the id() stable.
+_remap_tables_cache: Optional[Tuple[Dict[Any, Any], Dict[int, int], Set[int]]] = None
+
+
+def _remap_tables(rs_drums_by_note: Dict[Any, Any]) -> Tuple[Dict[int, int], Set[int]]:
+    global _remap_tables_cache
+    cached = _remap_tables_cache
+    if cached is not None and cached[0] is rs_drums_by_note:
+        return cached[1], cached[2]
+
+    gm_to_rs = _build_gm_to_rs(rs_drums_by_note)
+
+    rs_valid: Set[int] = set()
+    for k in rs_drums_by_note.keys():
+        try:
+            rs_valid.add(int(k))
+        except Exception:
+            pass
+
+    _remap_tables_cache = (rs_drums_by_note, gm_to_rs, rs_valid)
+    return gm_to_rs, rs_valid
+
+
 def remap_channel_9_notes_in_place(
     notes: List[object],
     rs_drums_by_note: Dict[Any, Any],
@@ -115,14 +144,7 @@ def remap_channel_9_notes_in_place(
     Mutates NoteEvent.pitch for channel 9 notes.
     Returns: (changed_count, unmapped_original_pitches)
     """
-    gm_to_rs = _build_gm_to_rs(rs_drums_by_note)
-
-    rs_valid: Set[int] = set()
-    for k in rs_drums_by_note.keys():
-        try:
-            rs_valid.add(int(k))
-        except Exception:
-            pass
+    gm_to_rs, rs_valid = _remap_tables(rs_drums_by_note)
 
     changed = 0
     unmapped: Set[int] = set()
@@ -1,7 +1,84 @@
 from __future__ import annotations
 
 from pathlib import Path
-import mido
+from typing import Iterator, Optional, Set, Tuple
+
+
+def _iter_events(track: bytes) -> Iterator[Tuple[int, int, Optional[int]]]:
+    """
+    Walk a raw MTrk body yielding (delta, status, meta_type) per event.
+    Handles running status, meta events and sysex; data bytes are skipped.
+    """
+    i = 0
+    n = len(track)
+    running: Optional[int] = None
+
+    while i < n:
+        # delta time (variable-length quantity)
+        delta = 0
+        while True:
+            b = track[i]
+            i += 1
+            delta = (delta << 7) | (b & 0x7F)
+            if not b & 0x80:
+                break
+
+        b = track[i]
+        if b >= 0x80:
+            status = b
+            i += 1
+            if status < 0xF0:
+                running = status
+        else:
+            if running is None:
+                raise ValueError("MIDI track uses running status before any status byte")
+            status = running
+
+        if status == 0xFF:
+            meta_type = track[i]
+            i += 1
+            length = 0
+            while True:
+                b = track[i]
+                i += 1
+                length = (length << 7) | (b & 0x7F)
+                if not b & 0x80:
+                    break
+            yield delta, status, meta_type
+            i += length
+        elif status in (0xF0, 0xF7):
+            length = 0
+            while True:
+                b = track[i]
+                i += 1
+                length = (length << 7) | (b & 0x7F)
+                if not b & 0x80:
+                    break
+            yield delta, status, None
+            i += length
+        else:
+            yield delta, status, None
+            # program change / channel pressure carry 1 data byte, rest 2
+            i += 1 if status & 0xF0 in (0xC0, 0xD0) else 2
+
+
+def _scan_time_zero(track: bytes) -> Tuple[bool, Set[int]]:
+    """
+    One pass over the leading zero-delta events: returns whether a set_tempo
+    exists at tick 0 and which channels already have a program_change there.
+    Stops at the first non-zero delta — everything after is not at time 0.
+    """
+    has_tempo = False
+    pc_channels: Set[int] = set()
+    for delta, status, meta_type in _iter_events(track):
+        if delta != 0:
+            break
+        if status == 0xFF:
+            if meta_type == 0x51:
+                has_tempo = True
+        elif status & 0xF0 == 0xC0:
+            pc_channels.add(status & 0x0F)
+    return has_tempo, pc_channels
 
 
 def inject_init_events(
@@ -26,53 +103,78 @@ def inject_init_events(
     Notes:
       - This does not move any notes between channels.
       - It tries to avoid duplicating existing set_tempo or program_change-at-time-0 messages.
+      - Works as a byte-level patch on the first MTrk chunk: the injected
+        events are spliced in as one blob and the chunk length is fixed up,
+        so the (possibly large) rest of the file is never decoded/re-encoded.
+        Safe because running status cannot apply to the first event of a
+        track, so full-status events prepended at the start change nothing.
     """
-    mid = mido.MidiFile(str(in_mid))
-
-    if len(mid.tracks) == 0:
-        mid.tracks.append(mido.MidiTrack())
+    data = Path(in_mid).read_bytes()
+    if data[:4] != b"MThd":
+        raise ValueError(f"Not a MIDI file (missing MThd): {in_mid}")
+    header_len = int.from_bytes(data[4:8], "big")
 
-    t0 = mid.tracks[0]
+    # Locate the first MTrk chunk (skip any alien chunks per the SMF spec)
+    pos = 8 + header_len
+    track_start: Optional[int] = None
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        chunk_len = int.from_bytes(data[pos + 4:pos + 8], "big")
+        if chunk_id == b"MTrk":
+            track_start = pos
+            break
+        pos += 8 + chunk_len
 
-    # Helper: detect whether a message already exists at time 0
-    def has_meta_set_tempo_at_0(track: mido.MidiTrack) -> bool:
-        return any(msg.time == 0 and msg.is_meta and msg.type == "set_tempo" for msg in track)
+    track = b""
+    if track_start is not None:
+        track_len = int.from_bytes(data[track_start + 4:track_start + 8], "big")
+        track = data[track_start + 8:track_start + 8 + track_len]
 
-    def has_program_change_at_0(track: mido.MidiTrack, channel: int) -> bool:
-        return any(
-            msg.time == 0
-            and (not msg.is_meta)
-            and msg.type == "program_change"
-            and getattr(msg, "channel", None) == channel
-            for msg in track
-        )
+    # Build the injection payload: tempo first, then melodic PCs, then drum PC,
+    # all with zero delta time, skipping events already present at time 0.
+    payload = bytearray()
 
-    inserts: list[mido.Message] = []
+    has_tempo, have_pc = _scan_time_zero(track)
 
-    # Tempo at time 0 (only if none exists at time 0)
-    if not has_meta_set_tempo_at_0(t0):
-        inserts.append(
-            mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(int(tempo_bpm)), time=0)
-        )
+    if not has_tempo:
+        tempo = round(60_000_000 / int(tempo_bpm))
+        payload += b"\x00\xff\x51\x03" + tempo.to_bytes(3, "big")
 
-    # Melodic program changes at time 0
     for ch in range(int(max_melodic_channels)):
-        if has_program_change_at_0(t0, ch):
+        if ch in have_pc:
             continue
-        prog = int(program_base) + ch
-        inserts.append(mido.Message("program_change", channel=ch, program=int(prog), time=0))
+        payload += bytes((0x00, 0xC0 | ch, int(program_base) + ch))
 
-    # Drum channel program change at time 0 -> program 0 (VOICE 0)
     if drum_midi_channel is not None:
         drum_ch = int(drum_midi_channel)
-        if 0 <= drum_ch <= 15 and not has_program_change_at_0(t0, drum_ch):
-            inserts.append(mido.Message("program_change", channel=drum_ch, program=0, time=0))
+        if 0 <= drum_ch <= 15 and drum_ch not in have_pc:
+            payload += bytes((0x00, 0xC0 | drum_ch, 0))
 
-    # Insert all at the start. Keep relative order: tempo first, then melodic PCs, then drum PC.
-    # If we didn't insert tempo (already existed), we still insert PCs at the beginning.
-    for i, msg in enumerate(inserts):
-        t0.insert(i, msg)
+    # Stream the pieces through the buffered file instead of joining one
+    # whole-file copy in memory first
+    if track_start is None:
+        # No track at all: append a fresh one holding just our events + EOT
+        body = bytes(payload) + b"\x00\xff\x2f\x00"
+        ntrks = int.from_bytes(data[10:12], "big") + 1
+        pieces = (
+            data[:10],
+            ntrks.to_bytes(2, "big"),
+            data[12:],
+            b"MTrk",
+            len(body).to_bytes(4, "big"),
+            body,
+        )
+    elif payload:
+        pieces = (
+            data[:track_start + 4],
+            (track_len + len(payload)).to_bytes(4, "big"),
+            payload,
+            data[track_start + 8:],
+        )
+    else:
+        pieces = (data,)
 
     out_mid = Path(out_mid)
     out_mid.parent.mkdir(parents=True, exist_ok=True)
-    mid.save(str(out_mid))
+    with open(out_mid, "wb") as fp:
+        fp.writelines(pieces)
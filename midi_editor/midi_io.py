@@ -1,90 +1,108 @@
 from __future__ import annotations
 
+import operator
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 import mido
 
 from midi_editor.models import MidiProject, NoteEvent
 
+# Message types that carry a .channel attribute; checking type membership is
+# cheaper than probing every message with getattr(..., None)
+_CHANNEL_TYPES = frozenset(
+    {"note_on", "note_off", "polytouch", "control_change", "program_change", "aftertouch", "pitchwheel"}
+)
 
-def _extract_tempo_bpm(mid: mido.MidiFile) -> int:
-    """
-    Return the first tempo found as BPM (clamped 30..300). Defaults to 120.
-    """
-    for tr in mid.tracks:
-        for msg in tr:
-            if msg.type == "set_tempo":
-                bpm = int(round(mido.tempo2bpm(msg.tempo)))
-                return max(30, min(300, bpm))
-    return 120
 
-
-def _extract_channel_track_names(mid: mido.MidiFile) -> Dict[int, str]:
+def _extract_tempo_and_track_names(mid: mido.MidiFile) -> Tuple[int, Dict[int, str]]:
     """
-    Best-effort:
-    - If a track has a track_name meta, assign it to any MIDI channels used in that track.
-    - First name wins per channel.
+    One pass over every track collecting both:
+    - the first tempo found, as BPM clamped 30..300 (default 120)
+    - best-effort channel labels: a track_name meta is assigned to any MIDI
+      channels used in that track; first name wins per channel.
     """
-    out: Dict[int, str] = {}
+    tempo_bpm: Optional[int] = None
+    names: Dict[int, str] = {}
 
     for tr in mid.tracks:
         track_name: Optional[str] = None
         channels_in_track: set[int] = set()
 
         for msg in tr:
-            if msg.is_meta and msg.type == "track_name":
-                name = getattr(msg, "name", None)
-                if isinstance(name, str) and not track_name:
-                    cleaned = name.strip()
-                    track_name = cleaned if cleaned else None
+            # one attribute lookup per message; the literals are interned so
+            # the comparisons below are pointer checks in the common case
+            tp = msg.type
+            if msg.is_meta:
+                if tp == "set_tempo" and tempo_bpm is None:
+                    bpm = int(round(mido.tempo2bpm(msg.tempo)))
+                    tempo_bpm = max(30, min(300, bpm))
+                elif tp == "track_name" and not track_name:
+                    name = getattr(msg, "name", None)
+                    if isinstance(name, str):
+                        cleaned = name.strip()
+                        track_name = cleaned if cleaned else None
                 continue
 
-            ch = getattr(msg, "channel", None)
-            if isinstance(ch, int):
-                channels_in_track.add(ch)
+            if tp in _CHANNEL_TYPES:
+                channels_in_track.add(msg.channel)
 
         if track_name:
             for ch in sorted(channels_in_track):
-                out.setdefault(ch, track_name)
+                names.setdefault(ch, track_name)
 
-    return out
+    return (tempo_bpm if tempo_bpm is not None else 120), names
 
 
 def load_midi_as_notes(midi_path: Path) -> MidiProject:
-    mid = mido.MidiFile(str(midi_path))
-    tempo_bpm = _extract_tempo_bpm(mid)
-    track_names = _extract_channel_track_names(mid)
+    # clip=True clamps out-of-range data bytes instead of raising, so files
+    # from sloppy exporters still load (and skips mido's per-byte checks)
+    mid = mido.MidiFile(str(midi_path), clip=True)
+    tempo_bpm, track_names = _extract_tempo_and_track_names(mid)
 
     notes: List[NoteEvent] = []
 
+    # Per-track iteration is deliberate: mido's merged_track would collapse
+    # the file into one stream and lose the track_index we store on every
+    # note (and which save/export round-trips rely on), while note pairing
+    # must also stay per track to match how sequencers stack voices.
+    # Tracks are paired independently, but threading this loop doesn't pay:
+    # mido already decoded every message during MidiFile() above, the pairing
+    # is pure Python bytecode that holds the GIL, and processes would have to
+    # pickle the message lists. The win lives in keeping the per-message
+    # work small, not in parallelism.
     for t_idx, track in enumerate(mid.tracks):
         abs_tick = 0
 
-        # active[(channel, pitch)] = list[(start_tick, velocity)]
-        active: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        # active[(channel, pitch)] = FIFO of (start_tick, velocity); deque so
+        # dequeuing the oldest stacked note is O(1), not a list shift, and
+        # defaultdict so note-ons hit __missing__ only on a true first use
+        active: Dict[Tuple[int, int], Deque[Tuple[int, int]]] = defaultdict(deque)
+        add_note = notes.append
 
         for msg in track:
             abs_tick += msg.time
 
-            if msg.type == "note_on" and getattr(msg, "velocity", 0) > 0:
-                key = (int(msg.channel), int(msg.note))
-                active.setdefault(key, []).append((abs_tick, int(msg.velocity)))
-
-            elif msg.type == "note_off" or (msg.type == "note_on" and getattr(msg, "velocity", 0) == 0):
-                ch = int(msg.channel)
-                pitch = int(msg.note)
-                key = (ch, pitch)
-                if key in active and active[key]:
-                    start_tick, vel = active[key].pop(0)
+            # mido messages already carry ints, so no int() coercions or
+            # getattr probes; note_on always has a velocity field
+            tp = msg.type
+            if tp == "note_on" and msg.velocity > 0:
+                active[(msg.channel, msg.note)].append((abs_tick, msg.velocity))
+
+            elif tp == "note_off" or tp == "note_on":
+                key = (msg.channel, msg.note)
+                stack = active.get(key)
+                if stack:
+                    start_tick, vel = stack.popleft()
                     if abs_tick > start_tick:
-                        notes.append(
+                        add_note(
                             NoteEvent(
                                 start_tick=start_tick,
                                 end_tick=abs_tick,
-                                pitch=pitch,
+                                pitch=key[1],
                                 velocity=vel,
-                                channel=ch,
+                                channel=key[0],
                                 track_index=t_idx,
                             )
                         )
@@ -114,6 +132,23 @@ def load_midi_as_notes(midi_path: Path) -> MidiProject:
     return project
 
 
+# Single-byte VLQ encodings, precomputed: most real-world deltas are < 128
+_VLQ_SMALL = tuple(bytes((i,)) for i in range(128))
+
+
+def _encode_delta(value: int) -> bytes:
+    """Encode a delta time as a MIDI variable-length quantity."""
+    if value < 128:
+        return _VLQ_SMALL[value]
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.reverse()
+    return bytes(out)
+
+
 def save_project_to_midi(
     project: MidiProject,
     out_path: Path,
@@ -129,31 +164,45 @@ def save_project_to_midi(
       - optional program changes at tick 0 (from project.channel_instrument_id)
       - note_on/note_off events
     Returns warnings.
+
+    The events are serialized to SMF bytes directly: the export writes only
+    tempo/program_change/note on/off, so going through two mido.Message
+    objects per note (each validating fields on construction) just to
+    re-encode them again was the dominant cost of the save path.
     """
     warnings: List[str] = []
 
     notes = project.notes
 
     if normalize_to_channels_0_9:
-        over = sorted({n.channel for n in notes if n.channel > 9})
+        # One pass collects the offending channels and the kept notes (the
+        # caller's list is never mutated, only replaced here)
+        over: set[int] = set()
+        kept: List[NoteEvent] = []
+        for n in notes:
+            if n.channel > 9:
+                over.add(n.channel)
+            else:
+                kept.append(n)
         if over:
-            warnings.append(f"Channels over 9 present: {over}. Exportable channels are 0–9.")
+            warnings.append(f"Channels over 9 present: {sorted(over)}. Exportable channels are 0–9.")
             if drop_channels_over_9:
-                notes = [n for n in notes if n.channel <= 9]
+                notes = kept
                 warnings.append("Dropped notes on channels > 9 during export.")
 
-    mid = mido.MidiFile(ticks_per_beat=project.ticks_per_beat)
-    track0 = mido.MidiTrack()
-    mid.tracks.append(track0)
+    track = bytearray()
 
     # Tempo at tick 0
     if write_tempo:
         bpm = int(getattr(project, "tempo_bpm", 120))
         bpm = max(30, min(300, bpm))
-        track0.append(mido.MetaMessage("set_tempo", tempo=mido.bpm2tempo(bpm), time=0))
+        tempo = round(60_000_000 / bpm)
+        track += b"\x00\xff\x51\x03" + tempo.to_bytes(3, "big")
 
-    # Collect absolute-time events
-    events: List[Tuple[int, mido.Message]] = []
+    # Collect events keyed by one integer: (tick << 1) plus a low priority
+    # bit so note_off sorts before anything else on the same tick. That
+    # keeps the sort comparisons pure C int compares.
+    events: List[Tuple[int, bytes]] = []
 
     # Program changes at tick 0 (optional)
     if force_programs_at_start:
@@ -161,37 +210,50 @@ def save_project_to_midi(
             ch_i = int(ch)
             if normalize_to_channels_0_9 and ch_i > 9:
                 continue
-            events.append((0, mido.Message("program_change", channel=ch_i, program=int(program), time=0)))
+            # channel_instrument_id holds directsound ids, not GM programs;
+            # anything outside the SMF data-byte range would corrupt the file
+            # (mido used to reject these at save time, so keep raising)
+            program_i = int(program)
+            if not 0 <= program_i <= 127:
+                raise ValueError(f"program out of range 0..127 for channel {ch_i}: {program_i}")
+            events.append((1, bytes((0xC0 | ch_i, program_i))))
 
     # Notes
     for n in notes:
-        events.append(
-            (int(n.start_tick), mido.Message("note_on", channel=int(n.channel), note=int(n.pitch), velocity=int(n.velocity), time=0))
-        )
-        events.append(
-            (int(n.end_tick), mido.Message("note_off", channel=int(n.channel), note=int(n.pitch), velocity=0, time=0))
-        )
-
-    # Sort by tick; ensure note_off happens before note_on if same tick
-    def sort_key(item: Tuple[int, mido.Message]) -> Tuple[int, int]:
-        tick, msg = item
-        pri = 0
-        if msg.type == "note_off":
-            pri = -1
-        return (tick, pri)
-
-    events.sort(key=sort_key)
-
-    # Convert absolute -> delta times and append
+        ch = n.channel
+        pitch = n.pitch
+        events.append((n.start_tick << 1 | 1, bytes((0x90 | ch, pitch, n.velocity))))
+        events.append((n.end_tick << 1, bytes((0x80 | ch, pitch, 0))))
+
+    # One Timsort over the packed int keys beats merging two pre-sorted
+    # streams: neither the on- nor the off-events arrive sorted (notes are
+    # stored in pairing-completion order), so heapq.merge would need two
+    # sorts first and then a Python-level merge loop on top.
+    events.sort(key=operator.itemgetter(0))
+
+    # Convert absolute -> delta times and serialize
     last_tick = 0
-    for tick, msg in events:
-        delta = max(0, int(tick) - int(last_tick))
-        msg.time = delta
-        track0.append(msg)
+    for key, data in events:
+        tick = key >> 1
+        track += _encode_delta(tick - last_tick)
+        track += data
         last_tick = tick
 
-    track0.append(mido.MetaMessage("end_of_track", time=0))
+    track += b"\x00\xff\x2f\x00"  # end_of_track
+
+    header = (
+        b"MThd"
+        + (6).to_bytes(4, "big")
+        + (1).to_bytes(2, "big")  # format 1, matching what mido wrote before
+        + (1).to_bytes(2, "big")  # one track
+        + int(project.ticks_per_beat).to_bytes(2, "big")
+    )
+
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    mid.save(str(out_path))
+    # Write header and track body separately through the buffered file
+    # instead of concatenating one final whole-file copy
+    with open(out_path, "wb") as fp:
+        fp.write(header + b"MTrk" + len(track).to_bytes(4, "big"))
+        fp.write(track)
     return warnings
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
-@dataclass
+# slots: notes are the dominant allocation (one per MIDI note); this drops
+# the per-instance __dict__ and speeds up the attribute access hot paths
+@dataclass(slots=True)
 class NoteEvent:
     start_tick: int
     end_tick: int
@@ -17,9 +19,14 @@ class NoteEvent:
         return max(0, self.end_tick - self.start_tick)
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiProject:
     ticks_per_beat: int
+    # Deliberately a list of NoteEvent objects (not parallel SoA columns):
+    # the piano roll items and remap dialogs hold references to individual
+    # notes and mutate them in place, which column storage can't support
+    # without an id indirection layer. NoteEvent is slotted to keep the
+    # per-note cost down instead.
     notes: List[NoteEvent]
     # channel -> directsound instrument id (not GM program)
     channel_instrument_id: Dict[int, int]
@@ -32,14 +39,56 @@ class MidiProject:
     
     muted_channels: set[int] = field(default_factory=set)
 
+    # Lazy channel -> notes index. Valid only while it was built from the
+    # current notes list object at its current length; methods that relabel
+    # channels in place invalidate it explicitly.
+    _by_channel: Optional[Dict[int, List[NoteEvent]]] = field(default=None, init=False, repr=False)
+    _index_source: Optional[List[NoteEvent]] = field(default=None, init=False, repr=False)
+    _index_len: int = field(default=0, init=False, repr=False)
+
+    def _channel_index(self) -> Dict[int, List[NoteEvent]]:
+        notes = self.notes
+        if (
+            self._by_channel is None
+            or self._index_source is not notes
+            or self._index_len != len(notes)
+        ):
+            by_ch: Dict[int, List[NoteEvent]] = {}
+            for n in notes:
+                by_ch.setdefault(n.channel, []).append(n)
+            self._by_channel = by_ch
+            self._index_source = notes
+            self._index_len = len(notes)
+        return self._by_channel
+
+    def _invalidate_channel_index(self) -> None:
+        self._by_channel = None
+        self._index_source = None
+
     def used_channels(self) -> List[int]:
-        return sorted({n.channel for n in self.notes})
+        # Collect into a 16-bit mask, then unpack: no set build/sort needed
+        mask = 0
+        for n in self.notes:
+            mask |= 1 << n.channel
+        return [ch for ch in range(16) if mask >> ch & 1]
+
+    def has_channel(self, ch: int) -> bool:
+        """Early-exit membership test (cheaper than used_channels for gates)."""
+        return any(n.channel == ch for n in self.notes)
 
     def notes_for_channel(self, ch: int) -> List[NoteEvent]:
-        return [n for n in self.notes if n.channel == ch]
+        return list(self._channel_index().get(ch, ()))
+
+    def note_counts_by_channel(self) -> Dict[int, int]:
+        """Notes per channel, served from the lazy index."""
+        return {ch: len(ns) for ch, ns in self._channel_index().items()}
 
     def delete_channel(self, ch: int) -> None:
-        self.notes = [n for n in self.notes if n.channel != ch]
+        # Cheap early-exit probe first: don't reallocate the whole note list
+        # when the channel only has dict entries to clear
+        if self.has_channel(ch):
+            self.notes = [n for n in self.notes if n.channel != ch]
+            self._invalidate_channel_index()
         self.channel_instrument_id.pop(ch, None)
         self.channel_track_name.pop(ch, None)
 
@@ -49,6 +98,7 @@ class MidiProject:
         for n in self.notes:
             if n.channel == src:
                 n.channel = dst
+        self._invalidate_channel_index()
         self.channel_instrument_id.pop(src, None)
 
         # carry label to dst if dst doesn't already have one
@@ -56,35 +106,27 @@ class MidiProject:
             self.channel_track_name[dst] = self.channel_track_name[src]
         self.channel_track_name.pop(src, None)
 
+    @staticmethod
+    def _swap_keys(d: dict, a: int, b: int) -> None:
+        va = d.pop(a, None)
+        vb = d.pop(b, None)
+        if va is not None:
+            d[b] = va
+        if vb is not None:
+            d[a] = vb
+
     def swap_channels(self, a: int, b: int) -> None:
         if a == b:
             return
 
+        # Single pass over the notes; the channel relabel can't be fused any
+        # further without columnar storage (see the notes field comment)
         for n in self.notes:
             if n.channel == a:
                 n.channel = b
             elif n.channel == b:
                 n.channel = a
+        self._invalidate_channel_index()
 
-        ida = self.channel_instrument_id.get(a)
-        idb = self.channel_instrument_id.get(b)
-        if ida is None:
-            self.channel_instrument_id.pop(b, None)
-        else:
-            self.channel_instrument_id[b] = ida
-        if idb is None:
-            self.channel_instrument_id.pop(a, None)
-        else:
-            self.channel_instrument_id[a] = idb
-
-        # swap labels too
-        la = self.channel_track_name.get(a)
-        lb = self.channel_track_name.get(b)
-        if la is None:
-            self.channel_track_name.pop(b, None)
-        else:
-            self.channel_track_name[b] = la
-        if lb is None:
-            self.channel_track_name.pop(a, None)
-        else:
-            self.channel_track_name[a] = lb
+        self._swap_keys(self.channel_instrument_id, a, b)
+        self._swap_keys(self.channel_track_name, a, b)